@@ -0,0 +1,40 @@
+"""
+Small numeric kernels for the dashboard endpoints.
+
+Numba is optional: when it is installed the risk kernel is JIT-compiled
+into one fused pass over the input arrays; otherwise a NumPy fallback
+with identical semantics is used.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba not installed
+    njit = None
+
+
+def _risk_score_numpy(avg_pct, miss_cnt, inactivity_days):
+    grade_risk = 100.0 - avg_pct
+    missing_risk = np.minimum(100.0, miss_cnt * 10.0)
+    inactivity_risk = np.minimum(100.0, inactivity_days / 30.0 * 100.0)
+    return (grade_risk + missing_risk + inactivity_risk) / 3.0
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def risk_score(avg_pct, miss_cnt, inactivity_days):
+        out = np.empty(avg_pct.shape[0])
+        for i in prange(out.size):
+            grade_risk = 100.0 - avg_pct[i]
+            missing_risk = min(100.0, miss_cnt[i] * 10.0)
+            inactivity_risk = min(100.0, inactivity_days[i] / 30.0 * 100.0)
+            out[i] = (grade_risk + missing_risk + inactivity_risk) / 3.0
+        return out
+
+    # warm the JIT at import so the first request does not pay compilation
+    risk_score(np.zeros(1), np.zeros(1), np.zeros(1))
+else:
+    risk_score = _risk_score_numpy
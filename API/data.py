@@ -1,24 +1,244 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from fastapi import HTTPException
 
 BASE = Path(__file__).resolve().parents[1] / "db" / "sample_data"
 
 
+def _has_parquet(name: str) -> bool:
+    return (BASE / f"{name}.parquet").exists()
+
+
+def _read_table(
+    name: str,
+    parse_dates: list[str] | None = None,
+    columns: list[str] | None = None,
+    filters=None,
+):
+    # prefer parquet (written by analytics/convert_to_parquet.py): native
+    # dtypes, column projection, and predicate pushdown into row groups
+    if _has_parquet(name):
+        return pd.read_parquet(BASE / f"{name}.parquet", columns=columns, filters=filters)
+    return pd.read_csv(BASE / f"{name}.csv", parse_dates=parse_dates, usecols=columns)
+
+
+@lru_cache(maxsize=1)
+def _load_data_cached():
+    user_dim, course_dim, daily = load_dims()
+    enrol = _read_table("enrol_fact", parse_dates=["enrol_time"])
+    grade = _read_table("grade_fact", parse_dates=["graded_at"])
+    subm = _read_table("submission_fact", parse_dates=["submitted_at", "duedate"])
+    events = _read_table("event_log_staging", parse_dates=["timestamp"])
+    return user_dim, course_dim, enrol, grade, subm, events, daily
+
+
 def load_data():
+    # parsed once per process; call reload_data() after regenerating the CSVs
+    return _load_data_cached()
+
+
+def _split(df: pd.DataFrame, key: str) -> dict[int, pd.DataFrame]:
+    return {int(k): part for k, part in df.groupby(key, sort=False)}
+
+
+@lru_cache(maxsize=1)
+def _by_course_cached():
+    _, _, enrol, grade, subm, events, _ = _load_data_cached()
+    return {
+        "enrol": (_split(enrol, "course_id"), enrol.iloc[0:0]),
+        "grade": (_split(grade, "course_id"), grade.iloc[0:0]),
+        "subm": (_split(subm, "course_id"), subm.iloc[0:0]),
+        "events": (_split(events, "course_id"), events.iloc[0:0]),
+    }
+
+
+@lru_cache(maxsize=1)
+def _by_user_cached():
+    _, _, _, grade, subm, events, _ = _load_data_cached()
+    return {
+        "grade": (_split(grade, "user_id"), grade.iloc[0:0]),
+        "subm": (_split(subm, "user_id"), subm.iloc[0:0]),
+        "events": (_split(events, "user_id"), events.iloc[0:0]),
+    }
+
+
+def by_course(table: str, course_id: int) -> pd.DataFrame:
+    """Rows of `table` for one course — a dict probe, not a full-frame scan."""
+    groups, empty = _by_course_cached()[table]
+    return groups.get(course_id, empty)
+
+
+def by_user(table: str, user_id: int) -> pd.DataFrame:
+    """Rows of `table` for one user — a dict probe, not a full-frame scan."""
+    groups, empty = _by_user_cached()[table]
+    return groups.get(user_id, empty)
+
+
+@lru_cache(maxsize=1)
+def valid_user_ids() -> frozenset[int]:
+    user_dim = load_dims()[0]
+    return frozenset(user_dim["user_id"].astype(int).tolist())
+
+
+@lru_cache(maxsize=1)
+def valid_teacher_ids() -> frozenset[int]:
+    user_dim = load_dims()[0]
+    return frozenset(user_dim.loc[user_dim.role == "teacher", "user_id"].astype(int).tolist())
+
+
+@lru_cache(maxsize=1)
+def valid_student_ids() -> frozenset[int]:
+    user_dim = load_dims()[0]
+    return frozenset(user_dim.loc[user_dim.role == "student", "user_id"].astype(int).tolist())
+
+
+@lru_cache(maxsize=1)
+def valid_mentor_ids() -> frozenset[int]:
+    mentor_profile = _read_table("mentor_profile")
+    return frozenset(mentor_profile["mentor_id"].astype(int).tolist())
+
+
+@lru_cache(maxsize=1)
+def course_name_map() -> dict[int, str]:
+    course_dim = load_dims()[1]
+    return dict(zip(course_dim["course_id"].astype(int), course_dim["fullname"]))
+
+
+@lru_cache(maxsize=1)
+def load_dims():
+    """(user_dim, course_dim, daily) — the small dimension tables only.
+
+    Endpoints that work on a single course can pair this with
+    load_course_data() and never materialize the full fact tables.
+    """
     if not BASE.exists():
         raise HTTPException(status_code=500, detail="sample_data not found")
+    user_dim = _read_table("user_dim")
+    # low-cardinality string column: int8 codes compare faster than objects
+    user_dim["role"] = user_dim["role"].astype("category")
+    return (
+        user_dim,
+        _read_table("course_dim"),
+        _read_table("daily_course_kpi", parse_dates=["date"]),
+    )
+
+
+@lru_cache(maxsize=32)
+def load_course_data(course_id: int):
+    """(enrol, grade, subm) for one course.
 
-    user_dim = pd.read_csv(BASE / "user_dim.csv")
-    course_dim = pd.read_csv(BASE / "course_dim.csv")
-    enrol = pd.read_csv(BASE / "enrol_fact.csv", parse_dates=["enrol_time"])
-    grade = pd.read_csv(BASE / "grade_fact.csv", parse_dates=["graded_at"])
-    subm = pd.read_csv(
-        BASE / "submission_fact.csv", parse_dates=["submitted_at", "duedate"]
+    With parquet present the course_id predicate is pushed into the
+    reader, so only matching row groups are decoded and memory scales
+    with the course, not the dataset. Falls back to the in-memory
+    per-course groupings otherwise.
+    """
+    if _has_parquet("grade_fact"):
+        flt = [("course_id", "=", course_id)]
+        return (
+            _read_table("enrol_fact", filters=flt),
+            _read_table("grade_fact", filters=flt),
+            _read_table("submission_fact", filters=flt),
+        )
+    return (
+        by_course("enrol", course_id),
+        by_course("grade", course_id),
+        by_course("subm", course_id),
     )
-    events = pd.read_csv(BASE / "event_log_staging.csv", parse_dates=["timestamp"])
-    daily = pd.read_csv(BASE / "daily_course_kpi.csv", parse_dates=["date"])
-    return user_dim, course_dim, enrol, grade, subm, events, daily
+
+
+@lru_cache(maxsize=1)
+def _events_table() -> pa.Table:
+    """The event log held as an Arrow table; masks run in C++ kernels."""
+    if _has_parquet("event_log_staging"):
+        return pq.read_table(BASE / "event_log_staging.parquet")
+    return pa.Table.from_pandas(_load_data_cached()[5], preserve_index=False)
+
+
+def events_for_courses(course_ids, user_ids=None) -> pd.DataFrame:
+    """Events restricted to `course_ids` (and optionally `user_ids`).
+
+    Filtering happens on the Arrow table via pyarrow.compute; only the
+    (small) filtered result is converted to pandas.
+    """
+    tbl = _events_table()
+    mask = pc.is_in(tbl["course_id"], value_set=pa.array(list(course_ids)))
+    if user_ids is not None:
+        mask = pc.and_(
+            mask, pc.is_in(tbl["user_id"], value_set=pa.array(list(user_ids)))
+        )
+    return tbl.filter(mask).to_pandas()
+
+
+@lru_cache(maxsize=1)
+def last_ts_by_user() -> pd.Series:
+    """user_id -> last event timestamp, over all courses."""
+    events = _load_data_cached()[5]
+    return events.groupby("user_id")["timestamp"].max()
+
+
+@lru_cache(maxsize=1)
+def last_ts_by_user_course() -> pd.Series:
+    """(user_id, course_id) -> last event timestamp."""
+    events = _load_data_cached()[5]
+    return events.groupby(["user_id", "course_id"])["timestamp"].max()
+
+
+@lru_cache(maxsize=1)
+def data_today() -> pd.Timestamp:
+    """The dataset's "today": last daily-KPI date, fixed until reload."""
+    daily = load_dims()[2]
+    return daily["date"].max() if len(daily) else pd.Timestamp.today().normalize()
+
+
+@lru_cache(maxsize=1)
+def subm_masks():
+    """Boolean arrays over the full submission frame, shared by endpoints.
+
+    Valid as long as data_today() is — both caches are dropped together
+    on reload.
+    """
+    subm = _load_data_cached()[4]
+    today_ts = data_today()
+    return {
+        "overdue": (subm["duedate"] < today_ts).to_numpy(),
+        "unsubmitted": subm["submitted_at"].isna().to_numpy(),
+    }
+
+
+@lru_cache(maxsize=1)
+def load_mentor_data():
+    """(idea, match, pitch, mentor_profile) for the mentor dashboard."""
+    idea = _read_table("idea_dim")
+    # normalize student column once here rather than per request
+    if "student_userid" not in idea.columns and "student_id" in idea.columns:
+        idea = idea.rename(columns={"student_id": "student_userid"})
+    match = _read_table("mentor_match", parse_dates=["matched_at"])
+    pitch = _read_table("pitch_readiness")
+    mentor_profile = _read_table("mentor_profile")
+    return idea, match, pitch, mentor_profile
+
+
+def reload_data():
+    _load_data_cached.cache_clear()
+    _by_course_cached.cache_clear()
+    _by_user_cached.cache_clear()
+    load_dims.cache_clear()
+    load_course_data.cache_clear()
+    valid_user_ids.cache_clear()
+    valid_teacher_ids.cache_clear()
+    valid_student_ids.cache_clear()
+    valid_mentor_ids.cache_clear()
+    course_name_map.cache_clear()
+    load_mentor_data.cache_clear()
+    data_today.cache_clear()
+    subm_masks.cache_clear()
+    last_ts_by_user.cache_clear()
+    last_ts_by_user_course.cache_clear()
+    _events_table.cache_clear()
@@ -1,11 +1,20 @@
+import pandas as pd
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from .data import reload_data
+
+# views of the cached frames stay cheap; writes trigger a copy instead
+# of mutating shared data
+pd.options.mode.copy_on_write = True
 from .student import router as student_router
 from .teacher_course import router as teacher_course_router
 from .teacher_overall import router as teacher_overall_router
 from .mentor import router as mentor_router
 
-app = FastAPI(title="LMS API", version="0.1.0")
+# orjson renders the record-heavy dashboard payloads in C instead of
+# the stdlib json encoder
+app = FastAPI(title="LMS API", version="0.1.0", default_response_class=ORJSONResponse)
 
 
 @app.get("/health")
@@ -13,6 +22,12 @@ def health():
     return {"status": "ok"}
 
 
+@app.post("/admin/reload")
+def admin_reload():
+    reload_data()
+    return {"status": "reloaded"}
+
+
 app.include_router(student_router)
 app.include_router(teacher_course_router)
 app.include_router(teacher_overall_router)
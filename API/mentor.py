@@ -1,41 +1,33 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException
 
-from .data import load_data
+from .data import data_today, load_mentor_data, valid_mentor_ids
 
 router = APIRouter(prefix="/mentor", tags=["mentor"])
 
 
 @router.get("/{mentor_id}/dashboard")
 def mentor_dashboard(mentor_id: int):
-    user_dim, course_dim, enrol, grade, subm, events, daily = load_data()
+    # mentor-specific datasets, parsed once per cache lifetime
+    idea, match, pitch, mentor_profile = load_mentor_data()
 
-    # load mentor-specific datasets
-    from pathlib import Path
-    from .data import BASE
-
-    idea = pd.read_csv(BASE / "idea_dim.csv")
-    match = pd.read_csv(BASE / "mentor_match.csv", parse_dates=["matched_at"])
-    pitch = pd.read_csv(BASE / "pitch_readiness.csv")
-    mentor_profile = pd.read_csv(BASE / "mentor_profile.csv")
-
-    if mentor_id not in set(mentor_profile["mentor_id"].astype(int)):
+    if mentor_id not in valid_mentor_ids():
         raise HTTPException(status_code=404, detail="mentor_id not found")
 
-    # normalize student column
-    if "student_userid" not in idea.columns and "student_id" in idea.columns:
-        idea = idea.rename(columns={"student_id": "student_userid"})
-
     READY_THRESHOLD = 80
     NEW_DAYS = 7
 
-    my_match = match[match.mentor_id == mentor_id].copy()
-    my_ideas = idea[idea.idea_id.isin(my_match.idea_id)].copy()
+    # read-only views: no need to copy the filtered frames
+    my_match = match[match.mentor_id == mentor_id]
+    my_ideas = idea[idea.idea_id.isin(my_match.idea_id)]
 
-    idea_count = int(my_ideas["idea_id"].nunique())
-    mentee_count = int(my_ideas["student_userid"].nunique()) if len(my_ideas) else 0
+    idea_count = int(np.unique(my_ideas["idea_id"].to_numpy()).size)
+    mentee_count = (
+        int(np.unique(my_ideas["student_userid"].to_numpy()).size) if len(my_ideas) else 0
+    )
 
     pitch_ready_cnt = 0
     if "match_id" in pitch.columns:
@@ -46,11 +38,10 @@ def mentor_dashboard(mentor_id: int):
             ).sum()
         )
 
-    today = daily["date"].max().date() if len(daily) else pd.Timestamp.today().date()
     matched_recent = my_match[
-        my_match["matched_at"] >= (pd.Timestamp(today) - pd.Timedelta(days=NEW_DAYS))
+        my_match["matched_at"] >= (data_today() - pd.Timedelta(days=NEW_DAYS))
     ]
-    new_ideas_cnt = int(matched_recent["idea_id"].nunique())
+    new_ideas_cnt = int(np.unique(matched_recent["idea_id"].to_numpy()).size)
 
     return {
         "mentor_id": mentor_id,
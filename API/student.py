@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
 
-from .data import load_data
+from .data import (
+    by_course,
+    by_user,
+    course_name_map,
+    data_today,
+    last_ts_by_user,
+    valid_user_ids,
+)
 
 router = APIRouter(prefix="/student", tags=["student"])
 
@@ -13,45 +21,52 @@ def student_dashboard(
     user_id: int,
     course_id: int = Query(1, gt=0),
 ):
-    user_dim, course_dim, enrol, grade, subm, events, daily = load_data()
-
-    if user_id not in set(user_dim["user_id"].astype(int)):
+    if user_id not in valid_user_ids():
         raise HTTPException(status_code=404, detail="user_id not found")
 
-    today = daily["date"].max().date() if len(daily) else pd.Timestamp.today().date()
+    # compare against the shared midnight Timestamp: stays in int64 ns
+    # instead of boxing a Python date per row
+    today_ts = data_today()
+    today = today_ts.date()
 
-    course_row = course_dim[course_dim.course_id == course_id]
-    if course_row.empty:
+    course_names = course_name_map()
+    if course_id not in course_names:
         raise HTTPException(status_code=404, detail="course_id not found")
-    course_name = course_row["fullname"].iat[0]
-
-    total_items = grade[grade.course_id == course_id]["item_id"].nunique()
-    completed_items = subm[
-        (subm.course_id == course_id)
-        & (subm.user_id == user_id)
-        & (subm.submitted_at.notna())
-    ]["activity_id"].nunique()
+    course_name = course_names[course_id]
+
+    my_subm = by_user("subm", user_id)
+    # np.unique on the int id arrays: no hashmap or NaN handling needed
+    total_items = np.unique(by_course("grade", course_id)["item_id"].to_numpy()).size
+    completed_items = np.unique(
+        my_subm.loc[
+            (my_subm.course_id == course_id) & (my_subm.submitted_at.notna()),
+            "activity_id",
+        ].to_numpy()
+    ).size
     progress_pct = 100 * completed_items / total_items if total_items else 0
 
-    df_grade = grade[(grade.course_id == course_id) & (grade.user_id == user_id)].copy()
+    my_grade = by_user("grade", user_id)
+    df_grade = my_grade[my_grade.course_id == course_id]
     avg_grade_pct = (
         (df_grade["score"] / df_grade["maxscore"]).mean() * 100 if len(df_grade) else 0
     )
 
-    due_soon = subm[
-        (subm.user_id == user_id)
-        & (subm["duedate"].dt.date >= today)
-        & (subm["duedate"].dt.date <= today + pd.Timedelta(days=7))
-        & (subm["submitted_at"].isna())
-    ].merge(course_dim[["course_id", "fullname"]], on="course_id", how="left")
+    # build the shared masks once; due_soon and missing differ only in the
+    # duedate window
+    due = my_subm["duedate"]
+    unsubmitted = my_subm["submitted_at"].isna()
+
+    # attach course names with a dict map instead of a hash-join per request
+    due_soon = my_subm[
+        # "due within 7 days" inclusive of the 7th day
+        unsubmitted & (due >= today_ts) & (due < today_ts + pd.Timedelta(days=8))
+    ]
+    due_soon = due_soon.assign(fullname=due_soon["course_id"].map(course_names))
 
-    missing = subm[
-        (subm.user_id == user_id)
-        & (subm["duedate"].dt.date < today)
-        & (subm["submitted_at"].isna())
-    ].merge(course_dim[["course_id", "fullname"]], on="course_id", how="left")
+    missing = my_subm[unsubmitted & (due < today_ts)]
+    missing = missing.assign(fullname=missing["course_id"].map(course_names))
 
-    last_active_ts = events[events.user_id == user_id]["timestamp"].max()
+    last_active_ts = last_ts_by_user().get(user_id, pd.NaT)
     if pd.isna(last_active_ts):
         days_inactive = None
         last_active = None
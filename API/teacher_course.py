@@ -1,55 +1,74 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException
 
-from .data import load_data
+from ._kernels import risk_score
+from .data import data_today, last_ts_by_user_course, load_course_data, load_dims
 
 router = APIRouter(prefix="/teacher/course", tags=["teacher"])
 
 
 @router.get("/{course_id}/dashboard")
 def teacher_course_dashboard(course_id: int):
-    user_dim, course_dim, enrol, grade, subm, events, daily = load_data()
+    user_dim, course_dim, daily = load_dims()
 
     course_row = course_dim[course_dim.course_id == course_id]
     if course_row.empty:
         raise HTTPException(status_code=404, detail="course_id not found")
     course_name = course_row["fullname"].iat[0]
 
-    today = daily["date"].max().date() if len(daily) else pd.Timestamp.today().date()
+    today_ts = data_today()
 
-    total_students = enrol[enrol.course_id == course_id]["user_id"].nunique()
+    # course_id predicate is pushed to the parquet reader where possible
+    course_enrol, g, s = load_course_data(course_id)
+    total_students = np.unique(course_enrol["user_id"].to_numpy()).size
 
-    g = grade[grade.course_id == course_id]
     avg_grade_pct = (g.score / g.maxscore).mean() * 100 if len(g) else 0
 
-    s = subm[subm.course_id == course_id]
-    missing = s[(s.submitted_at.isna()) & (s.duedate.dt.date < today)]
-    missing_per_student = (
-        missing.groupby("user_id").size().sort_values(ascending=False)
+    # count missing submissions per student straight off the mask — no
+    # intermediate frame or groupby
+    missing_mask = s["submitted_at"].isna().to_numpy() & (
+        s["duedate"] < today_ts
+    ).to_numpy()
+    missing_count = int(missing_mask.sum())
+    miss_uids, miss_counts = np.unique(
+        s["user_id"].to_numpy()[missing_mask], return_counts=True
+    )
+    missing_per_student = pd.Series(miss_counts, index=miss_uids).sort_values(
+        ascending=False
     )
 
-    risk_rows = []
-    for uid in enrol[enrol.course_id == course_id]["user_id"].unique():
-        stu_grade = g[g.user_id == uid]
-        avg_pct = (stu_grade.score / stu_grade.maxscore).mean() * 100 if len(stu_grade) else 0
-        grade_risk = 100 - avg_pct
-
-        miss_cnt = missing_per_student.get(uid, 0)
-        missing_risk = min(100, miss_cnt * 10)
+    all_uids = course_enrol["user_id"].unique()
 
-        last = events[
-            (events.course_id == course_id) & (events.user_id == uid)
-        ]["timestamp"].max()
-        inactivity = (today - last.date()).days if pd.notna(last) else 30
-        inactivity_risk = min(100, inactivity / 30 * 100)
+    # three groupby aggregates instead of a Python loop over students
+    avg_pct = (g["score"] / g["maxscore"]).groupby(g["user_id"]).mean() * 100
 
-        risk = (grade_risk + missing_risk + inactivity_risk) / 3
-        risk_rows.append((uid, risk))
+    ltuc = last_ts_by_user_course()
+    last_ts = ltuc[ltuc.index.get_level_values("course_id") == course_id].droplevel(
+        "course_id"
+    )
+    inactivity = (
+        (today_ts - last_ts.dt.normalize())
+        .dt.days.reindex(all_uids)
+        .fillna(30)
+        .to_numpy(dtype=np.float64)
+    )
 
     risk_df = (
-        pd.DataFrame(risk_rows, columns=["user_id", "risk_pct"])
+        pd.DataFrame(
+            {
+                "user_id": all_uids,
+                "risk_pct": risk_score(
+                    avg_pct.reindex(all_uids).fillna(0).to_numpy(dtype=np.float64),
+                    missing_per_student.reindex(all_uids)
+                    .fillna(0)
+                    .to_numpy(dtype=np.float64),
+                    inactivity,
+                ),
+            }
+        )
         .sort_values("risk_pct", ascending=False)
     )
     at_risk_threshold = 60
@@ -78,7 +97,7 @@ def teacher_course_dashboard(course_id: int):
         "course_name": course_name,
         "total_students": int(total_students),
         "avg_grade_pct": round(avg_grade_pct, 1),
-        "missing_submissions": int(len(missing)),
+        "missing_submissions": missing_count,
         "course_rating": {"avg_rating": avg_rating, "num_ratings": num_ratings},
         "at_risk_pct": round(at_risk_pct, 1),
         "at_risk_count": at_risk_count,
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException
 
-from .data import load_data
+from ._kernels import risk_score
+from .data import (
+    data_today,
+    events_for_courses,
+    last_ts_by_user,
+    last_ts_by_user_course,
+    load_data,
+    subm_masks,
+    valid_student_ids,
+    valid_teacher_ids,
+)
 
 router = APIRouter(prefix="/teacher", tags=["teacher"])
 
@@ -12,16 +23,16 @@ router = APIRouter(prefix="/teacher", tags=["teacher"])
 def teacher_overall_dashboard(teacher_id: int):
     user_dim, course_dim, enrol, grade, subm, events, daily = load_data()
 
-    if teacher_id not in set(user_dim[user_dim.role == "teacher"]["user_id"].astype(int)):
+    if teacher_id not in valid_teacher_ids():
         raise HTTPException(status_code=404, detail="teacher_id not found")
 
-    today = daily["date"].max().date() if len(daily) else pd.Timestamp.today().date()
+    today_ts = data_today()
 
     # courses managed by teacher (demo assumption)
     teacher_courses = enrol[enrol.user_id == teacher_id]["course_id"].unique()
 
     # students enrolled in teacher's courses (exclude teachers)
-    student_ids = set(user_dim[user_dim.role == "student"]["user_id"].astype(int))
+    student_ids = valid_student_ids()
     students_in_teacher_courses = [
         uid
         for uid in enrol[enrol.course_id.isin(teacher_courses)]["user_id"].unique()
@@ -31,47 +42,54 @@ def teacher_overall_dashboard(teacher_id: int):
     total_students = int(len(students_in_teacher_courses))
     total_courses = int(len(teacher_courses))
 
-    # inactive students >= 7 days (within teacher courses)
-    last_activity = (
-        events[events.user_id.isin(students_in_teacher_courses)]
-        .groupby("user_id")["timestamp"]
-        .max()
-        .reset_index()
-    )
+    # inactive students >= 7 days (within teacher courses); last-activity
+    # timestamps come from the load-time groupby in data.py
+    last_activity = last_ts_by_user().reindex(students_in_teacher_courses)
     inactive_students_7d = int(
-        (last_activity["timestamp"].dt.date < today - pd.Timedelta(days=7)).sum()
+        (last_activity < today_ts - pd.Timedelta(days=7)).sum()
     )
 
-    # risk per student (simple risk) across teacher courses
+    # risk per student (simple risk) across teacher courses; the overdue and
+    # unsubmitted masks are prebuilt once per cache lifetime in data.py
     g = grade[grade.course_id.isin(teacher_courses)]
-    s = subm[subm.course_id.isin(teacher_courses)]
-    missing = s[(s.submitted_at.isna()) & (s.duedate.dt.date < today)]
+    in_tc = subm["course_id"].isin(teacher_courses).to_numpy()
+    masks = subm_masks()
+    missing = subm[in_tc & masks["unsubmitted"] & masks["overdue"]]
     missing_per_student = missing.groupby("user_id").size()
 
-    risk_rows = []
-    for uid in students_in_teacher_courses:
-        stu_grade = g[g.user_id == uid]
-        avg_pct = (
-            (stu_grade.score / stu_grade.maxscore).mean() * 100 if len(stu_grade) else 0
-        )
-        grade_risk = 100 - avg_pct
-
-        miss_cnt = missing_per_student.get(uid, 0)
-        missing_risk = min(100, miss_cnt * 10)
-
-        last = events[
-            (events.user_id == uid) & (events.course_id.isin(teacher_courses))
-        ]["timestamp"].max()
-        inactivity = (today - last.date()).days if pd.notna(last) else 30
-        inactivity_risk = min(100, inactivity / 30 * 100)
+    # groupby aggregates over the teacher-course-filtered frames instead of
+    # re-filtering per student in a Python loop
+    all_uids = pd.Index(students_in_teacher_courses)
+    avg_pct = (g["score"] / g["maxscore"]).groupby(g["user_id"]).mean() * 100
 
-        risk = (grade_risk + missing_risk + inactivity_risk) / 3
-        risk_rows.append((uid, risk))
+    ltuc = last_ts_by_user_course()
+    last_by_user = (
+        ltuc[ltuc.index.get_level_values("course_id").isin(teacher_courses)]
+        .groupby(level="user_id")
+        .max()
+    )
+    inactivity = (
+        (today_ts - last_by_user.dt.normalize())
+        .dt.days.reindex(all_uids)
+        .fillna(30)
+        .to_numpy(dtype=np.float64)
+    )
 
     risk_df = (
-        pd.DataFrame(risk_rows, columns=["user_id", "risk_pct"])
+        pd.DataFrame(
+            {
+                "user_id": all_uids,
+                "risk_pct": risk_score(
+                    avg_pct.reindex(all_uids).fillna(0).to_numpy(dtype=np.float64),
+                    missing_per_student.reindex(all_uids)
+                    .fillna(0)
+                    .to_numpy(dtype=np.float64),
+                    inactivity,
+                ),
+            }
+        )
         .sort_values("risk_pct", ascending=False)
-        if risk_rows
+        if len(all_uids)
         else pd.DataFrame(columns=["user_id", "risk_pct"])
     )
 
@@ -79,30 +97,33 @@ def teacher_overall_dashboard(teacher_id: int):
     at_risk_count = int((risk_df["risk_pct"] > at_risk_threshold).sum())
     at_risk_pct = (at_risk_count / len(risk_df) * 100) if len(risk_df) else 0
 
-    # avg learning hours (proxy) - teacher courses only
-    events_tc = events[events.user_id.isin(students_in_teacher_courses)].copy()
-    events_tc = events_tc[events_tc.course_id.isin(teacher_courses)]
-    events_tc.sort_values(["user_id", "timestamp"], inplace=True)
-    events_tc["next_ts"] = events_tc.groupby("user_id")["timestamp"].shift(-1)
-    events_tc["session_gap_min"] = (
-        (events_tc.next_ts - events_tc.timestamp).dt.total_seconds() / 60
+    # avg learning hours (proxy) - teacher courses only; gaps via np.diff on
+    # the sorted int64 timestamps instead of a groupby-shift temporary
+    events_tc = events_for_courses(
+        teacher_courses, students_in_teacher_courses
+    ).sort_values(["user_id", "timestamp"])
+    # normalize to ns — parquet-loaded frames may carry datetime64[us]
+    ts_ns = events_tc["timestamp"].to_numpy(dtype="datetime64[ns]").view("i8")
+    uid_arr = events_tc["user_id"].to_numpy()
+    gap_min = np.diff(ts_ns) / 6e10
+    same_user = uid_arr[1:] == uid_arr[:-1]
+    session_gaps = gap_min[same_user & (gap_min >= 1) & (gap_min <= 30)]
+    avg_learning_hours = (
+        round(float(session_gaps.mean()) / 60, 2) if session_gaps.size else float("nan")
+    )
+
+    # ungraded submissions (overdue + not graded) within teacher courses,
+    # as a hash-probe anti-join — no merged frame or indicator column
+    submitted_mask = in_tc & ~masks["unsubmitted"]
+    submitted = subm[submitted_mask]
+    graded_idx = pd.MultiIndex.from_frame(g[["course_id", "user_id", "item_id"]])
+    sub_idx = pd.MultiIndex.from_frame(
+        submitted[["course_id", "user_id", "activity_id"]]
     )
-    events_tc = events_tc[events_tc.session_gap_min.between(1, 30)]
-    avg_learning_hours = round(events_tc.session_gap_min.mean() / 60, 2)
-
-    # ungraded submissions (overdue + not graded) within teacher courses
-    submitted = s[s.submitted_at.notna()].copy()
-    submitted["is_overdue"] = submitted["duedate"].dt.date < today
-    graded_keys = g[["course_id", "user_id", "item_id"]]
-    merged = submitted.merge(
-        graded_keys,
-        left_on=["course_id", "user_id", "activity_id"],
-        right_on=["course_id", "user_id", "item_id"],
-        how="left",
-        indicator=True,
+    is_graded = sub_idx.isin(graded_idx)
+    ungraded_submissions = int(
+        (masks["overdue"][submitted_mask] & ~is_graded).sum()
     )
-    overdue_ungraded = merged[(merged.is_overdue) & (merged._merge == "left_only")]
-    ungraded_submissions = int(overdue_ungraded.shape[0])
 
     return {
         "teacher_id": teacher_id,
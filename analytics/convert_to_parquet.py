@@ -0,0 +1,51 @@
+"""
+One-shot conversion of the sample_data CSVs to Parquet.
+
+Run after gen_demo_for_analytics.py; the API prefers a `<table>.parquet`
+file over `<table>.csv` when one exists, which skips text parsing and
+date re-inference on load and lets readers project columns / push down
+filters. CSVs are left in place as the fallback.
+
+Usage (from repo root):
+  python analytics/convert_to_parquet.py
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+BASE = Path(__file__).resolve().parents[1] / "db" / "sample_data"
+
+# table name -> datetime columns (mirrors the parse_dates= in API/data.py)
+TABLES = {
+    "user_dim": [],
+    "course_dim": [],
+    "enrol_fact": ["enrol_time"],
+    "grade_fact": ["graded_at"],
+    "submission_fact": ["submitted_at", "duedate"],
+    "event_log_staging": ["timestamp"],
+    "daily_course_kpi": ["date"],
+    "course_rating": [],
+    "idea_dim": [],
+    "mentor_profile": [],
+    "mentor_match": ["matched_at"],
+    "pitch_readiness": ["rated_at"],
+}
+
+
+def main():
+    converted = 0
+    for name, date_cols in TABLES.items():
+        csv_path = BASE / f"{name}.csv"
+        if not csv_path.exists():
+            print(f"skip {name}: no CSV")
+            continue
+        df = pd.read_csv(csv_path, parse_dates=date_cols or None)
+        df.to_parquet(BASE / f"{name}.parquet", index=False)
+        converted += 1
+    print(f"Wrote {converted} parquet files to {BASE}")
+
+
+if __name__ == "__main__":
+    main()
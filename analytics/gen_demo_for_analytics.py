@@ -39,10 +39,20 @@ Outputs to LMS/db/sample_data:
 from __future__ import annotations
 
 import csv
+import multiprocessing
+import os
 import random
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 
 # ---------------- Configuration ---------------- #
 SEED = 42
@@ -68,166 +78,168 @@ EVENTS_PER_ACTIVE_DAY = (4, 10)  # min/max events per active user per day
 MISSING_SUBMISSION_RATE = 0.10  # keep missing tasks reasonable
 
 random.seed(SEED)
+# batched draws for the hot loops (events, scores); Python random stays
+# for the small one-off choices
+rng = np.random.default_rng(SEED)
 BASE = Path(__file__).resolve().parents[1] / "db" / "sample_data"
 BASE.mkdir(parents=True, exist_ok=True)
 
 
-def daterange(start: datetime, end: datetime):
-    d = start
-    while d <= end:
-        yield d
-        d += timedelta(days=1)
+START_EPOCH = int(START_DATE.timestamp())
+
+
+def to_epoch(dt: datetime) -> int:
+    # integer math from the fixed start epoch; datetime.timestamp() pays
+    # for tz resolution on every call
+    return START_EPOCH + int((dt - START_DATE).total_seconds())
+
+
+# the day axis is iterated by several sections (events, KPIs, metrics);
+# build it once instead of regenerating ~150 datetimes per consumer
+DAYS = [
+    START_DATE + timedelta(days=i)
+    for i in range((END_DATE - START_DATE).days + 1)
+]
+DAY_DATES = [d.date() for d in DAYS]
+# formatted once for the per-day emitters (KPIs, metrics): indexing a
+# prebuilt string beats an isoformat() dispatch per output row
+DAY_ISO = [d.isoformat() for d in DAY_DATES]
 
 
 # ---------------- Users ---------------- #
-mdl_user: List[Dict] = []
-user_dim: List[Dict] = []
+# accumulators hold positional tuples in the column order written by
+# write_csv below — no per-row dict allocation
+mdl_user: List[Tuple] = []
+user_dim: List[Tuple] = []  # (user_id, fullname, role, created_at)
+ROLE_COUNTS = [
+    ("student", NUM_STUDENTS),
+    ("teacher", NUM_TEACHERS),
+    ("mentor", NUM_MENTORS),
+    ("investor", NUM_INVESTORS),
+]
+_start_day = START_DATE.date()
 uid = 1
-
-def add_user(role: str):
-    global uid
+# one block per role: the firstname choice and created_at date are
+# hoisted out of the per-user work instead of re-derived in a helper call
+for role, count in ROLE_COUNTS:
     firstname = "Student" if role == "student" else "Teacher"
-    mdl_user.append(
-        {
-            "id": uid,
-            "auth": "manual",
-            "confirmed": 1,
-            "deleted": 0,
-            "suspended": 0,
-            "mnethostid": 1,
-            "username": f"{role}{uid:03d}",
-            "firstname": firstname,
-            "lastname": f"{uid:03d}",
-            "email": f"{role}{uid:03d}@example.com",
-            "timecreated": int(START_DATE.timestamp()),
-        }
-    )
-    user_dim.append(
-        {
-            "user_id": uid,
-            "fullname": f"{firstname} {uid:03d}",
-            "role": role,
-            "created_at": START_DATE.date(),
-        }
-    )
-    uid += 1
-
-for _ in range(NUM_STUDENTS):
-    add_user("student")
-for _ in range(NUM_TEACHERS):
-    add_user("teacher")
-for _ in range(NUM_MENTORS):
-    add_user("mentor")
-for _ in range(NUM_INVESTORS):
-    add_user("investor")
+    for _ in range(count):
+        mdl_user.append(
+            (
+                uid,
+                "manual",
+                1,
+                0,
+                0,
+                1,
+                f"{role}{uid:03d}",
+                firstname,
+                f"{uid:03d}",
+                f"{role}{uid:03d}@example.com",
+                START_EPOCH,
+            )
+        )
+        user_dim.append((uid, f"{firstname} {uid:03d}", role, _start_day))
+        uid += 1
 
-student_ids = [u["user_id"] for u in user_dim if u["role"] == "student"]
-teacher_ids = [u["user_id"] for u in user_dim if u["role"] == "teacher"]
-mentor_ids = [u["user_id"] for u in user_dim if u["role"] == "mentor"]
-investor_ids = [u["user_id"] for u in user_dim if u["role"] == "investor"]
+student_ids = [u[0] for u in user_dim if u[2] == "student"]
+teacher_ids = [u[0] for u in user_dim if u[2] == "teacher"]
+mentor_ids = [u[0] for u in user_dim if u[2] == "mentor"]
+investor_ids = [u[0] for u in user_dim if u[2] == "investor"]
+# array view for rng.choice sampling (C implementation, no per-element
+# Python RNG calls like random.sample)
+student_ids_arr = np.array(student_ids)
 
 
 # ---------------- Categories & Courses ---------------- #
 mdl_course_categories = [
-    {"id": cid, "name": name, "timecreated": int(START_DATE.timestamp())}
-    for cid, name in CATEGORIES
+    (cid, name, START_EPOCH) for cid, name in CATEGORIES
 ]
 
-course_dim: List[Dict] = []
-mdl_course: List[Dict] = []
+course_dim: List[Tuple] = []  # (course_id, fullname, category, startdate)
+mdl_course: List[Tuple] = []
 for cid, fullname in COURSES:
     catid, _ = random.choice(CATEGORIES)
     startdate = START_DATE + timedelta(days=random.randint(0, 20))
     shortname = fullname.replace(" ", "")[:20]
-    course_dim.append(
-        {
-            "course_id": cid,
-            "fullname": fullname,
-            "category": _,
-            "startdate": startdate.date(),
-        }
-    )
+    course_dim.append((cid, fullname, _, startdate.date()))
     mdl_course.append(
-        {
-            "id": cid,
-            "category": catid,
-            "fullname": fullname,
-            "shortname": shortname,
-            "startdate": int(startdate.timestamp()),
-            "timecreated": int(startdate.timestamp()),
-        }
+        (
+            cid,
+            catid,
+            fullname,
+            shortname,
+            to_epoch(startdate),
+            to_epoch(startdate),
+        )
     )
 
 
 # ---------------- Enrolments ---------------- #
-mdl_enrol: List[Dict] = []
-mdl_user_enrolments: List[Dict] = []
-enrol_fact: List[Dict] = []
+mdl_enrol: List[Tuple] = []
+mdl_user_enrolments: List[Tuple] = []
+enrol_fact: List[Tuple] = []  # (course_id, user_id, enrol_time)
 enrol_id = 1
 ue_id = 1
 
 for cid, _ in COURSES:
     # manual enrol instance
-    mdl_enrol.append(
-        {
-            "id": enrol_id,
-            "enrol": "manual",
-            "status": 0,
-            "courseid": cid,
-            "timecreated": int(START_DATE.timestamp()),
-        }
-    )
+    mdl_enrol.append((enrol_id, "manual", 0, cid, START_EPOCH))
     # one teacher
     tid = random.choice(teacher_ids)
-    mdl_user_enrolments.append(
-        {
-            "id": ue_id,
-            "enrolid": enrol_id,
-            "userid": tid,
-            "timestart": int(START_DATE.timestamp()),
-        }
-    )
-    enrol_fact.append(
-        {"course_id": cid, "user_id": tid, "enrol_time": START_DATE + timedelta(days=1)}
-    )
+    mdl_user_enrolments.append((ue_id, enrol_id, tid, START_EPOCH))
+    enrol_fact.append((cid, tid, START_DATE + timedelta(days=1)))
     ue_id += 1
-    # students
-    enrolled_students = random.sample(
-        student_ids, k=min(len(student_ids), random.randint(20, 35))
-    )
-    for sid in enrolled_students:
-        etime = START_DATE + timedelta(days=random.randint(0, 30))
-        mdl_user_enrolments.append(
-            {
-                "id": ue_id,
-                "enrolid": enrol_id,
-                "userid": sid,
-                "timestart": int(etime.timestamp()),
-            }
-        )
-        enrol_fact.append({"course_id": cid, "user_id": sid, "enrol_time": etime})
+    # students; the roster and all enrol-day offsets come from two batched
+    # draws per course instead of one scalar RNG call per student
+    enrolled_students = rng.choice(
+        student_ids_arr,
+        size=min(len(student_ids), int(rng.integers(20, 36))),
+        replace=False,
+    ).tolist()
+    enrol_days = rng.integers(0, 31, len(enrolled_students))
+    for sid, day_off in zip(enrolled_students, enrol_days):
+        etime = START_DATE + timedelta(days=int(day_off))
+        mdl_user_enrolments.append((ue_id, enrol_id, sid, to_epoch(etime)))
+        enrol_fact.append((cid, sid, etime))
         ue_id += 1
     enrol_id += 1
 
-# enrolled students across all courses (for idea generation)
-enrolled_student_ids = sorted(
-    {e["user_id"] for e in enrol_fact if e["user_id"] in student_ids}
-)
+# per-course student rosters and a (course, user) -> enrol_time lookup,
+# built in one pass so later sections stop rescanning enrol_fact
+student_set = set(student_ids)
+students_by_course: Dict[int, List[int]] = defaultdict(list)
+enrol_time_by_key: Dict[Tuple[int, int], datetime] = {}
+for c, u, t in enrol_fact:
+    enrol_time_by_key[(c, u)] = t
+    if u in student_set:
+        students_by_course[c].append(u)
+
+# enrolled students across all courses (for idea generation);
+# student_ids is already sorted, so a membership pass over it replaces
+# the set-then-sort idiom
+enrolled_set = {u for _, u, _ in enrol_fact}
+enrolled_student_ids = [s for s in student_ids if s in enrolled_set]
 
 # ---------------- Activities (assign as proxy) ---------------- #
-mdl_assign: List[Dict] = []
-mdl_assign_submission: List[Dict] = []
-mdl_grade_items: List[Dict] = []
-mdl_grade_grades: List[Dict] = []
-mdl_course_modules: List[Dict] = []
-mdl_course_modules_completion: List[Dict] = []
-mdl_course_modules_viewed: List[Dict] = []
-mdl_course_completion_criteria: List[Dict] = []
-mdl_course_completion_crit_compl: List[Dict] = []
-mdl_course_completions: List[Dict] = []
-
-submission_fact: List[Dict] = []
-grade_fact: List[Dict] = []
+mdl_assign: List[Tuple] = []
+mdl_assign_submission: List[Tuple] = []
+mdl_grade_items: List[Tuple] = []
+mdl_grade_grades: List[Tuple] = []
+mdl_course_modules: List[Tuple] = []
+mdl_course_modules_completion: List[Tuple] = []
+mdl_course_modules_viewed: List[Tuple] = []
+mdl_course_completion_criteria: List[Tuple] = []
+mdl_course_completion_crit_compl: List[Tuple] = []
+mdl_course_completions: List[Tuple] = []
+
+submission_fact: List[Tuple] = []  # (course_id, user_id, activity_id, submitted_at, duedate)
+grade_fact: List[Tuple] = []  # (course_id, user_id, item_id, score, maxscore, graded_at)
+
+# maintained inline as submissions are generated, so the completion
+# section reads them instead of rescanning submission_fact
+submitted_by_cu: Dict[Tuple[int, int], set] = defaultdict(set)
+last_sub_by_cu: Dict[Tuple[int, int], datetime] = {}
 
 assign_id = 1
 grade_item_id = 1
@@ -244,122 +256,87 @@ course_assignments: Dict[int, List[int]] = {cid: [] for cid, _ in COURSES}
 course_modules_by_course: Dict[int, List[int]] = {cid: [] for cid, _ in COURSES}
 
 for cid, _ in COURSES:
+    students = students_by_course[cid]
+    n = len(students)
+    due_jitter = rng.integers(-3, 4, ITEMS_PER_COURSE)
     for i in range(ITEMS_PER_COURSE):
-        duedate = START_DATE + timedelta(days=20 + i * 25 + random.randint(-3, 3))
+        duedate = START_DATE + timedelta(days=20 + i * 25 + int(due_jitter[i]))
         mdl_assign.append(
-            {
-                "id": assign_id,
-                "course": cid,
-                "name": f"Assignment {i+1}",
-                "duedate": int(duedate.timestamp()),
-                "timemodified": int(duedate.timestamp()),
-            }
+            (
+                assign_id,
+                cid,
+                f"Assignment {i+1}",
+                to_epoch(duedate),
+                to_epoch(duedate),
+            )
         )
         course_assignments[cid].append(assign_id)
         # course module placeholder (module id for assign often 1 in fresh installs)
-        mdl_course_modules.append(
-            {
-                "id": cmid,
-                "course": cid,
-                "module": 1,  # not used here
-                "instance": assign_id,
-                "section": 1,
-            }
-        )
+        mdl_course_modules.append((cmid, cid, 1, assign_id, 1))
         course_modules_by_course[cid].append(cmid)
         mdl_grade_items.append(
-            {
-                "id": grade_item_id,
-                "courseid": cid,
-                "itemtype": "mod",
-                "itemmodule": "assign",
-                "iteminstance": assign_id,
-                "itemname": f"Assignment {i+1}",
-                "grademax": 100,
-            }
+            (
+                grade_item_id,
+                cid,
+                "mod",
+                "assign",
+                assign_id,
+                f"Assignment {i+1}",
+                100,
+            )
         )
-        # submissions and grades for enrolled students
-        course_students = [
-            e["user_id"] for e in enrol_fact if e["course_id"] == cid and e["user_id"] in student_ids
-        ]
-        for sid in course_students:
-            missing = random.random() < MISSING_SUBMISSION_RATE
-            if missing:
+        # submissions and grades for enrolled students; one batched draw
+        # per assignment instead of 4-5 RNG calls per student
+        missing_draw = rng.random(n)
+        jitter_hours = rng.integers(-24, 49, n)
+        scores = rng.normal(78, 10, n).clip(45, 98)
+        graded_hours = rng.integers(2, 25, n)
+        viewed_draw = rng.random(n)
+        for j, sid in enumerate(students):
+            if missing_draw[j] < MISSING_SUBMISSION_RATE:
                 # no submission record; mark in fact with null submitted_at
-                submission_fact.append(
-                    {
-                        "course_id": cid,
-                        "user_id": sid,
-                        "activity_id": assign_id,
-                        "submitted_at": None,
-                        "duedate": duedate,
-                    }
-                )
+                submission_fact.append((cid, sid, assign_id, None, duedate))
             else:
-                jitter = random.randint(-24, 48)
-                submitted = duedate + timedelta(hours=jitter)
+                submitted = duedate + timedelta(hours=int(jitter_hours[j]))
                 mdl_assign_submission.append(
-                    {
-                        "id": sub_id,
-                        "assignment": assign_id,
-                        "userid": sid,
-                        "status": "submitted",
-                        "timecreated": int(submitted.timestamp()),
-                        "timemodified": int(submitted.timestamp()),
-                    }
-                )
-                submission_fact.append(
-                    {
-                        "course_id": cid,
-                        "user_id": sid,
-                        "activity_id": assign_id,
-                        "submitted_at": submitted,
-                        "duedate": duedate,
-                    }
+                    (
+                        sub_id,
+                        assign_id,
+                        sid,
+                        "submitted",
+                        to_epoch(submitted),
+                        to_epoch(submitted),
+                    )
                 )
-                score = max(45, min(98, random.gauss(78, 10)))
-                graded = submitted + timedelta(hours=random.randint(2, 24))
+                submission_fact.append((cid, sid, assign_id, submitted, duedate))
+                cu = (cid, sid)
+                submitted_by_cu[cu].add(assign_id)
+                prev = last_sub_by_cu.get(cu)
+                if prev is None or submitted > prev:
+                    last_sub_by_cu[cu] = submitted
+                score = float(scores[j])
+                graded = submitted + timedelta(hours=int(graded_hours[j]))
                 mdl_grade_grades.append(
-                    {
-                        "id": gg_id,
-                        "itemid": grade_item_id,
-                        "userid": sid,
-                        "rawgrade": round(score, 2),
-                        "finalgrade": round(score, 2),
-                        "timemodified": int(graded.timestamp()),
-                    }
-                )
-                grade_fact.append(
-                    {
-                        "course_id": cid,
-                        "user_id": sid,
-                        "item_id": assign_id,
-                        "score": round(score, 2),
-                        "maxscore": 100,
-                        "graded_at": graded,
-                    }
+                    (
+                        gg_id,
+                        grade_item_id,
+                        sid,
+                        round(score, 2),
+                        round(score, 2),
+                        to_epoch(graded),
+                    )
                 )
+                grade_fact.append((cid, sid, assign_id, round(score, 2), 100, graded))
                 # completion
                 completionstate = 1 if submitted <= duedate + timedelta(hours=72) else 0
                 mdl_course_modules_completion.append(
-                    {
-                        "id": cmc_id,
-                        "coursemoduleid": cmid,
-                        "userid": sid,
-                        "completionstate": completionstate,
-                        "timemodified": int(submitted.timestamp()),
-                    }
+                    (cmc_id, cmid, sid, completionstate, to_epoch(submitted))
                 )
                 cmc_id += 1
                 # also mark module viewed (simple proxy)
-                if random.random() > 0.2:
+                if viewed_draw[j] > 0.2:
                     mdl_course_modules_viewed.append(
-                        {
-                            "id": cmv_id,
-                            "coursemoduleid": cmid,
-                            "userid": sid,
-                            "timecreated": int(submitted.timestamp()),
-                        }
+                        (cmv_id, cmid, sid, to_epoch(submitted))
                     )
                     cmv_id += 1
                 sub_id += 1
@@ -370,45 +347,140 @@ for cid, _ in COURSES:
 
 
 # ---------------- Events / Logs ---------------- #
-mdl_logstore_standard_log: List[Dict] = []
-event_log: List[Dict] = []
-log_id = 1
-for cid, _ in COURSES:
-    course_students = [
-        e["user_id"] for e in enrol_fact if e["course_id"] == cid and e["user_id"] in student_ids
-    ]
-    for d in daterange(START_DATE, END_DATE):
-        active_count = max(1, int(len(course_students) * random.uniform(0.35, 0.7)))
-        active_users = random.sample(course_students, k=min(len(course_students), active_count))
-        for uid in active_users:
-            events_today = random.randint(*EVENTS_PER_ACTIVE_DAY)
-            for _ in range(events_today):
-                ts = datetime(d.year, d.month, d.day, random.randint(6, 22), random.randint(0, 59))
-                event_type = random.choice(["viewed", "submitted", "graded", "posted"])
-                mdl_logstore_standard_log.append(
-                    {
-                        "id": log_id,
-                        "eventname": f"\\core\\event\\{event_type}",
-                        "component": "core",
-                        "action": event_type,
-                        "target": "course",
-                        "objectid": cid,
-                        "userid": uid,
-                        "courseid": cid,
-                        "contextid": cid,
-                        "timecreated": int(ts.timestamp()),
-                        "origin": "web",
-                    }
-                )
-                event_log.append(
-                    {
-                        "user_id": uid,
-                        "course_id": cid,
-                        "timestamp": ts,
-                        "event_type": event_type,
-                    }
-                )
-                log_id += 1
+# The event tables dominate row count. Courses are independent, so each
+# course's shard is generated in its own process with a deterministically
+# derived seed, then merged in course order; the log ids are assigned in
+# a single renumbering pass during the merge so primary keys stay unique
+# and sequential.
+# interned once: per-row columns reference these four strings instead of
+# allocating a new str per event (as ndarray.tolist() on a str array does)
+EVENT_TYPES = ["viewed", "submitted", "graded", "posted"]
+EVENTNAMES = ["\\core\\event\\" + t for t in EVENT_TYPES]
+# "HH:MM:00" lookup indexed by hour*60 + minute, so per-event time
+# strings come from fancy indexing instead of per-row formatting
+hm_str = np.array([f"{h:02d}:{m:02d}:00" for h in range(24) for m in range(60)])
+# per-day midnight epochs and date strings, computed once: skips the
+# datetime construction and ~1µs tz-resolving timestamp() call per event
+# row, indexed by position on the shared day axis
+day_epochs = [int(d.timestamp()) for d in DAYS]
+day_strs = [d.strftime("%Y-%m-%d") for d in DAYS]
+
+
+def gen_course_events(cid: int):
+    """One course's event shard as column lists (active counts + SoA columns).
+
+    Uses its own RNG seeded from (SEED, cid) so shards are reproducible
+    regardless of worker scheduling.
+    """
+    crng = np.random.default_rng([SEED, cid])
+    course_students = np.array(students_by_course[cid])
+    active: Dict[tuple, int] = {}
+    col_uids: List[int] = []
+    col_types: List[str] = []
+    col_names: List[str] = []
+    col_epochs: List[int] = []
+    col_ts: List[str] = []
+    for i, day_date in enumerate(DAY_DATES):
+        midnight = day_epochs[i]
+        day_str = day_strs[i]
+        active_count = max(1, int(len(course_students) * crng.uniform(0.35, 0.7)))
+        # one batch of draws per day: users, per-user event counts, and
+        # per-event times/types, instead of 3-4 Python RNG calls per event
+        active_users = crng.choice(
+            course_students,
+            size=min(len(course_students), active_count),
+            replace=False,
+        )
+        # sampled without replacement, so the draw is already distinct
+        # users: keep the DAU count, not a set of boxed ints
+        active[(cid, day_date)] = len(active_users)
+        events_per_user = crng.integers(
+            EVENTS_PER_ACTIVE_DAY[0], EVENTS_PER_ACTIVE_DAY[1] + 1, len(active_users)
+        )
+        total = int(events_per_user.sum())
+        hours = crng.integers(6, 23, total)
+        mins = crng.integers(0, 60, total)
+        etype_idx = crng.integers(0, 4, total).tolist()
+        # struct-of-arrays: each column stays a flat list, ready to become
+        # an Arrow array without any row-tuple round trip
+        col_uids.extend(np.repeat(active_users, events_per_user).tolist())
+        col_epochs.extend((midnight + hours * 3600 + mins * 60).tolist())
+        col_ts.extend(np.char.add(day_str + " ", hm_str[hours * 60 + mins]).tolist())
+        col_types.extend(EVENT_TYPES[k] for k in etype_idx)
+        col_names.extend(EVENTNAMES[k] for k in etype_idx)
+    return active, col_uids, col_types, col_names, col_epochs, col_ts
+
+
+active_by_day: Dict[tuple, int] = {}
+ev_uids: List[int] = []
+ev_types: List[str] = []
+ev_names: List[str] = []
+ev_epochs: List[int] = []
+ev_ts: List[str] = []
+ev_cids: List[int] = []
+# the script runs at module level, so worker processes must inherit the
+# already-built state via fork; under spawn/forkserver each worker would
+# re-import (and re-run) this file. Where fork is unavailable, generate
+# the courses serially instead — the per-(SEED, cid) worker seeding keeps
+# the output identical either way.
+try:
+    _fork_ctx = multiprocessing.get_context("fork")
+except ValueError:
+    _fork_ctx = None
+if _fork_ctx is not None:
+    with ProcessPoolExecutor(max_workers=len(COURSES), mp_context=_fork_ctx) as pool:
+        _course_events = list(pool.map(gen_course_events, [cid for cid, _ in COURSES]))
+else:
+    _course_events = [gen_course_events(cid) for cid, _ in COURSES]
+for cid, (active, col_uids, col_types, col_names, col_epochs, col_ts) in zip(
+    [cid for cid, _ in COURSES], _course_events
+):
+    active_by_day.update(active)
+    ev_uids.extend(col_uids)
+    ev_types.extend(col_types)
+    ev_names.extend(col_names)
+    ev_epochs.extend(col_epochs)
+    ev_ts.extend(col_ts)
+    ev_cids.extend([cid] * len(col_uids))
+
+# both event tables format column-at-a-time in pyarrow's multithreaded
+# C++ CSV writer; quoting is disabled outright since no value contains a
+# delimiter, which keeps the bytes identical to the csv-module output
+_EV_WRITE_OPTS = pacsv.WriteOptions(
+    batch_size=8192, quoting_style="none", quoting_header="none"
+)
+n_events = len(ev_uids)
+pacsv.write_csv(
+    pa.table(
+        {
+            "id": np.arange(1, n_events + 1),
+            "eventname": ev_names,
+            "component": ["core"] * n_events,
+            "action": ev_types,
+            "target": ["course"] * n_events,
+            "objectid": ev_cids,
+            "userid": ev_uids,
+            "courseid": ev_cids,
+            "contextid": ev_cids,
+            "timecreated": ev_epochs,
+            "origin": ["web"] * n_events,
+        }
+    ),
+    BASE / "mdl_logstore_standard_log.csv",
+    write_options=_EV_WRITE_OPTS,
+)
+pacsv.write_csv(
+    pa.table(
+        {
+            "user_id": ev_uids,
+            "course_id": ev_cids,
+            "timestamp": ev_ts,
+            "event_type": ev_types,
+        }
+    ),
+    BASE / "event_log_staging.csv",
+    write_options=_EV_WRITE_OPTS,
+)
 
 
 # ---------------- Course Completion (core-like) ---------------- #
@@ -417,164 +489,138 @@ for cid, _ in COURSES:
     assign_list = course_assignments.get(cid, [])
     moduleinstance = assign_list[0] if assign_list else None
     mdl_course_completion_criteria.append(
-        {
-            "id": ccc_id,
-            "course": cid,
-            "criteriatype": 4,  # module completion (proxy)
-            "module": "assign",
-            "moduleinstance": moduleinstance if moduleinstance is not None else 0,
-            "courseinstance": 0,
-            "enrolperiod": None,
-            "timeend": None,
-            "gradepass": 60.0,
-            "role": 0,
-        }
+        (
+            ccc_id,
+            cid,
+            4,  # module completion (proxy)
+            "assign",
+            moduleinstance if moduleinstance is not None else 0,
+            0,
+            None,
+            None,
+            60.0,
+            0,
+        )
     )
     ccc_id += 1
 
 # Completion records per user/course (simple: completed if submitted all assignments)
+# grade scores grouped by (course, user) once instead of rescanning per student;
+# submitted activities and last-submission times were tracked inline above
+scores_by_cu: Dict[Tuple[int, int], List[float]] = defaultdict(list)
+for c, u, _, score, _, _ in grade_fact:
+    scores_by_cu[(c, u)].append(score)
+
+_no_subs: set = set()
 for cid, _ in COURSES:
-    course_students = [
-        e["user_id"] for e in enrol_fact if e["course_id"] == cid and e["user_id"] in student_ids
-    ]
     assign_list = set(course_assignments.get(cid, []))
-    for sid in course_students:
-        user_subs = [
-            s for s in submission_fact if s["course_id"] == cid and s["user_id"] == sid
-        ]
-        submitted_acts = {s["activity_id"] for s in user_subs if s["submitted_at"] is not None}
+    course_criteria = [crit for crit in mdl_course_completion_criteria if crit[1] == cid]
+    for sid in students_by_course[cid]:
+        submitted_acts = submitted_by_cu.get((cid, sid), _no_subs)
         completed = assign_list.issubset(submitted_acts) if assign_list else False
 
-        time_enrolled = next(
-            (e["enrol_time"] for e in enrol_fact if e["course_id"] == cid and e["user_id"] == sid),
-            START_DATE,
-        )
+        time_enrolled = enrol_time_by_key.get((cid, sid), START_DATE)
         time_started = time_enrolled
-        time_completed = None
-        if completed:
-            last_sub = max(s["submitted_at"] for s in user_subs if s["submitted_at"] is not None)
-            time_completed = last_sub
+        time_completed = last_sub_by_cu[(cid, sid)] if completed else None
 
         mdl_course_completions.append(
-            {
-                "id": cc_id,
-                "userid": sid,
-                "course": cid,
-                "timeenrolled": int(time_enrolled.timestamp()),
-                "timestarted": int(time_started.timestamp()),
-                "timecompleted": int(time_completed.timestamp()) if time_completed else None,
-                "reaggregate": 0,
-            }
+            (
+                cc_id,
+                sid,
+                cid,
+                to_epoch(time_enrolled),
+                to_epoch(time_started),
+                to_epoch(time_completed) if time_completed else None,
+                0,
+            )
         )
         cc_id += 1
 
         # completion criteria per user
-        for crit in mdl_course_completion_criteria:
-            if crit["course"] != cid:
-                continue
+        for crit in course_criteria:
             gradefinal = None
             if completed:
-                grades = [
-                    g["score"]
-                    for g in grade_fact
-                    if g["course_id"] == cid and g["user_id"] == sid
-                ]
+                grades = scores_by_cu.get((cid, sid), [])
                 gradefinal = round(sum(grades) / len(grades), 2) if grades else None
             mdl_course_completion_crit_compl.append(
-                {
-                    "id": cccc_id,
-                    "userid": sid,
-                    "course": cid,
-                    "criteriaid": crit["id"],
-                    "gradefinal": gradefinal,
-                    "unenroled": None,
-                    "timecompleted": int(time_completed.timestamp()) if time_completed else None,
-                }
+                (
+                    cccc_id,
+                    sid,
+                    cid,
+                    crit[0],  # criteria id
+                    gradefinal,
+                    None,
+                    to_epoch(time_completed) if time_completed else None,
+                )
             )
             cccc_id += 1
 
 # ---------------- Forum (Pending questions) ---------------- #
-mdl_forum: List[Dict] = []
-mdl_forum_discussions: List[Dict] = []
-mdl_forum_posts: List[Dict] = []
-forum_posts_slim: List[Dict] = []
+mdl_forum: List[Tuple] = []
+mdl_forum_discussions: List[Tuple] = []
+mdl_forum_posts: List[Tuple] = []
+# (course_id, discussion_id, post_id, user_id, parent_id, created_at)
+forum_posts_slim: List[Tuple] = []
 
 forum_id = 1
 discussion_id = 1
 post_id = 1
+# discussion_id -> [course_id, question_post_id, has_reply], maintained
+# while posts are created so no second pass over the posts is needed
+pending: Dict[int, list] = {}
 
 for cid, _ in COURSES:
     mdl_forum.append(
-        {
-            "id": forum_id,
-            "course": cid,
-            "name": f"Forum {cid}",
-            "type": "general",
-            "timecreated": int(START_DATE.timestamp()),
-        }
+        (forum_id, cid, f"Forum {cid}", "general", START_EPOCH)
     )
     # create discussions with some unanswered
     for _ in range(12):
         author = random.choice(student_ids)
         t = START_DATE + timedelta(days=random.randint(0, 120))
         mdl_forum_discussions.append(
-            {
-                "id": discussion_id,
-                "course": cid,
-                "forum": forum_id,
-                "name": f"Discussion {discussion_id}",
-                "userid": author,
-                "timecreated": int(t.timestamp()),
-            }
+            (
+                discussion_id,
+                cid,
+                forum_id,
+                f"Discussion {discussion_id}",
+                author,
+                to_epoch(t),
+            )
         )
         # main post
         main_post_id = post_id
         mdl_forum_posts.append(
-            {
-                "id": post_id,
-                "discussion": discussion_id,
-                "userid": author,
-                "parent": 0,
-                "created": int(t.timestamp()),
-                "subject": f"Question {post_id}",
-            }
-        )
-        forum_posts_slim.append(
-            {
-                "course_id": cid,
-                "discussion_id": discussion_id,
-                "post_id": post_id,
-                "user_id": author,
-                "parent_id": 0,
-                "created_at": t,
-            }
+            (
+                post_id,
+                discussion_id,
+                author,
+                0,
+                to_epoch(t),
+                f"Question {post_id}",
+            )
         )
+        forum_posts_slim.append((cid, discussion_id, post_id, author, 0, t))
+        pending[discussion_id] = [cid, post_id, False]
         post_id += 1
         # replies (50% unanswered)
         if random.random() > 0.5:
+            pending[discussion_id][2] = True
             reply_count = random.randint(1, 3)
             for _ in range(reply_count):
                 replier = random.choice(teacher_ids + student_ids)
                 rt = t + timedelta(hours=random.randint(1, 72))
                 mdl_forum_posts.append(
-                    {
-                        "id": post_id,
-                        "discussion": discussion_id,
-                        "userid": replier,
-                        "parent": main_post_id,
-                        "created": int(rt.timestamp()),
-                        "subject": f"Re: {post_id}",
-                    }
+                    (
+                        post_id,
+                        discussion_id,
+                        replier,
+                        main_post_id,
+                        to_epoch(rt),
+                        f"Re: {post_id}",
+                    )
                 )
                 forum_posts_slim.append(
-                    {
-                        "course_id": cid,
-                        "discussion_id": discussion_id,
-                        "post_id": post_id,
-                        "user_id": replier,
-                        "parent_id": main_post_id,
-                        "created_at": rt,
-                    }
+                    (cid, discussion_id, post_id, replier, main_post_id, rt)
                 )
                 post_id += 1
         discussion_id += 1
@@ -582,11 +628,11 @@ for cid, _ in COURSES:
 
 
 # ---------------- Feedback (Course rating) ---------------- #
-mdl_feedback: List[Dict] = []
-mdl_feedback_item: List[Dict] = []
-mdl_feedback_completed: List[Dict] = []
-mdl_feedback_value: List[Dict] = []
-course_rating: List[Dict] = []
+mdl_feedback: List[Tuple] = []
+mdl_feedback_item: List[Tuple] = []
+mdl_feedback_completed: List[Tuple] = []
+mdl_feedback_value: List[Tuple] = []
+course_rating: List[Tuple] = []
 
 feedback_id = 1
 item_id = 1
@@ -595,104 +641,125 @@ value_id = 1
 
 for cid, _ in COURSES:
     mdl_feedback.append(
-        {
-            "id": feedback_id,
-            "course": cid,
-            "name": f"Course rating {cid}",
-            "timeopen": int(START_DATE.timestamp()),
-            "timeclose": int(END_DATE.timestamp()),
-        }
-    )
-    mdl_feedback_item.append(
-        {
-            "id": item_id,
-            "feedback": feedback_id,
-            "name": "Overall rating",
-            "typ": "numeric",
-        }
+        (
+            feedback_id,
+            cid,
+            f"Course rating {cid}",
+            START_EPOCH,
+            to_epoch(END_DATE),
+        )
     )
+    mdl_feedback_item.append((item_id, feedback_id, "Overall rating", "numeric"))
     ratings = []
-    for sid in random.sample(student_ids, k=min(len(student_ids), 20)):
+    for sid in rng.choice(
+        student_ids_arr, size=min(len(student_ids), 20), replace=False
+    ).tolist():
         rt = START_DATE + timedelta(days=random.randint(10, 120))
         score = round(random.uniform(3.0, 5.0), 2)
         mdl_feedback_completed.append(
-            {
-                "id": completed_id,
-                "feedback": feedback_id,
-                "userid": sid,
-                "timemodified": int(rt.timestamp()),
-            }
-        )
-        mdl_feedback_value.append(
-            {
-                "id": value_id,
-                "item": item_id,
-                "completed": completed_id,
-                "value": score,
-            }
+            (completed_id, feedback_id, sid, to_epoch(rt))
         )
+        mdl_feedback_value.append((value_id, item_id, completed_id, score))
         ratings.append(score)
         completed_id += 1
         value_id += 1
     course_rating.append(
-        {
-            "course_id": cid,
-            "avg_rating": round(sum(ratings) / len(ratings), 2) if ratings else 0,
-            "num_ratings": len(ratings),
-        }
+        (
+            cid,
+            round(sum(ratings) / len(ratings), 2) if ratings else 0,
+            len(ratings),
+        )
     )
     feedback_id += 1
     item_id += 1
 
 
 # ---------------- Daily KPIs ---------------- #
-daily_course_kpi: List[Dict] = []
-for cid, _ in COURSES:
-    events_by_day = {}
-    for ev in event_log:
-        if ev["course_id"] != cid:
-            continue
-        day = ev["timestamp"].date()
-        events_by_day.setdefault(day, set()).add(ev["user_id"])
-    for day in daterange(START_DATE, END_DATE):
-        day_date = day.date()
-        active_users = len(events_by_day.get(day_date, set()))
-        subs = [
-            s
-            for s in submission_fact
-            if s["course_id"] == cid
-            and s["submitted_at"] is not None
-            and s["submitted_at"].date() == day_date
-        ]
-        submissions = len(subs)
-        completions = sum(
-            1 for s in subs if s["submitted_at"] is not None and s["submitted_at"] <= s["duedate"]
-        )
-        grades_today = [
-            g["score"]
-            for g in grade_fact
-            if g["course_id"] == cid and g["graded_at"].date() == day_date
-        ]
-        avg_grade = round(sum(grades_today) / len(grades_today), 2) if grades_today else 0
-        daily_course_kpi.append(
-            {
-                "course_id": cid,
-                "date": day_date.isoformat(),
-                "active_users": active_users,
-                "submissions": submissions,
-                "completions": completions,
-                "avg_grade": avg_grade,
-            }
-        )
+# dense (course, day) count/sum matrices accumulated by np.add.at: the
+# facts are gathered into index arrays in one pass, the additions run as
+# C loops, and the emission loop just reads cells — no per-key dict
+# hashing (active_by_day is merged from the per-course event shards above)
+course_pos = {cid: k for k, (cid, _) in enumerate(COURSES)}
+n_days = len(DAYS)
+subs_mat = np.zeros((len(COURSES), n_days), np.int64)
+comps_mat = np.zeros((len(COURSES), n_days), np.int64)
+sub_keys = [
+    (course_pos[c], (to_epoch(submitted) - START_EPOCH) // 86400, submitted <= duedate)
+    for c, _, _, submitted, duedate in submission_fact
+    if submitted is not None
+]
+if sub_keys:
+    s_ci, s_di, s_on_time = (np.array(col) for col in zip(*sub_keys))
+    np.add.at(subs_mat, (s_ci, s_di), 1)
+    np.add.at(comps_mat, (s_ci[s_on_time], s_di[s_on_time]), 1)
+
+grade_sum_mat = np.zeros((len(COURSES), n_days), np.float64)
+grade_cnt_mat = np.zeros((len(COURSES), n_days), np.int64)
+grade_keys = [
+    (course_pos[c], (to_epoch(graded) - START_EPOCH) // 86400, score)
+    for c, _, _, score, _, graded in grade_fact
+]
+if grade_keys:
+    g_ci, g_di, g_score = (np.array(col) for col in zip(*grade_keys))
+    np.add.at(grade_sum_mat, (g_ci, g_di), g_score)
+    np.add.at(grade_cnt_mat, (g_ci, g_di), 1)
+
+def gen_daily_kpi():
+    # derived straight from the matrices, so the rows are yielded into
+    # writerows inside the writer thread and never held as a full list
+    for cid, _ in COURSES:
+        k = course_pos[cid]
+        for di, (day_date, day_iso) in enumerate(zip(DAY_DATES, DAY_ISO)):
+            grades_cnt = int(grade_cnt_mat[k, di])
+            # float() first: round() on np.float64 rounds via scaling, which
+            # can differ from Python's correctly-rounded result in the last digit
+            avg_grade = round(float(grade_sum_mat[k, di]) / grades_cnt, 2) if grades_cnt else 0
+            yield (
+                cid,
+                day_iso,
+                active_by_day.get((cid, day_date), 0),
+                int(subs_mat[k, di]),
+                int(comps_mat[k, di]),
+                avg_grade,
+            )
 
 
 # ---------------- Write CSV helper ---------------- #
-def write_csv(name: str, fieldnames: List[str], rows: List[Dict]):
-    path = BASE / name
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+def _write_csv_now(name: str, fieldnames: List[str], rows: Iterable[Tuple]):
+    # plain csv.writer over positional tuples: one writerows call is a C
+    # loop with no per-cell dict lookup (DictWriter) and no frame
+    # construction; 1 MiB buffer keeps write() syscalls off the row path
+    with open(BASE / name, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        csv.writer(f, lineterminator="\n").writerows(chain((fieldnames,), rows))
+
+
+# the ~40 small tables are independent files, so their writes overlap on
+# a thread pool (file I/O releases the GIL); futures are drained before
+# the script reports completion
+_write_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+_write_futures: List = []
+
+
+def write_csv(name: str, fieldnames: List[str], rows: Iterable[Tuple]):
+    _write_futures.append(_write_pool.submit(_write_csv_now, name, fieldnames, rows))
+
+
+def _write_fmt_csv_now(name: str, fieldnames: List[str], rows: List[Tuple], fmt: str):
+    it = iter(rows)
+    with open(BASE / name, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(",".join(fieldnames) + "\n")
+        # ~1000 formatted rows join into a single write() call, so the
+        # buffered-write overhead is paid per batch rather than per row
+        while batch := list(islice(it, 1000)):
+            f.write("".join(fmt % r for r in batch))
+
+
+def write_fmt_csv(name: str, fieldnames: List[str], rows: List[Tuple], fmt: str):
+    """write_csv for all-numeric tables: one printf-style format string
+    per row skips the csv module's per-field quoting state machine."""
+    _write_futures.append(
+        _write_pool.submit(_write_fmt_csv_now, name, fieldnames, rows, fmt)
+    )
 
 
 # Simplified (for API/UI)
@@ -709,15 +776,11 @@ write_csv(
     ["course_id", "user_id", "activity_id", "submitted_at", "duedate"],
     submission_fact,
 )
-write_csv(
-    "event_log_staging.csv",
-    ["user_id", "course_id", "timestamp", "event_type"],
-    event_log,
-)
+# event_log_staging.csv is streamed by the events loop above
 write_csv(
     "daily_course_kpi.csv",
     ["course_id", "date", "active_users", "submissions", "completions", "avg_grade"],
-    daily_course_kpi,
+    gen_daily_kpi(),
 )
 write_csv(
     "forum_posts.csv",
@@ -725,61 +788,48 @@ write_csv(
     forum_posts_slim,
 )
 
-# Pending questions (derived: discussions where main post has no replies)
-pending = {}
-for row in forum_posts_slim:
-    if row["parent_id"] == 0:
-        pending[row["discussion_id"]] = {
-            "course_id": row["course_id"],
-            "question_post_id": row["post_id"],
-            "has_reply": False,
-        }
-    else:
-        if row["discussion_id"] in pending:
-            pending[row["discussion_id"]]["has_reply"] = True
-pending_rows = [
-    {"course_id": v["course_id"], "question_post_id": v["question_post_id"]}
-    for v in pending.values()
-    if not v["has_reply"]
-]
+# Pending questions (derived: discussions where main post has no replies;
+# flags were set inline during forum-post creation); a generator, so the
+# rows stream through writerows without an intermediate list
+pending_rows = ((c, pid) for c, pid, has_reply in pending.values() if not has_reply)
 write_csv("pending_questions.csv", ["course_id", "question_post_id"], pending_rows)
 
 write_csv("course_rating.csv", ["course_id", "avg_rating", "num_ratings"], course_rating)
 
 # ---------------- Mentor datasets ---------------- #
-idea_dim: List[Dict] = []
-mentor_profile: List[Dict] = []
-mentor_match: List[Dict] = []
-mentor_meeting: List[Dict] = []
-action_item: List[Dict] = []
-pitch_readiness: List[Dict] = []
+idea_dim: List[Tuple] = []  # (idea_id, student_id, domain_code, title, stage, created_at)
+mentor_profile: List[Tuple] = []
+mentor_match: List[Tuple] = []
+mentor_meeting: List[Tuple] = []
+action_item: List[Tuple] = []
+pitch_readiness: List[Tuple] = []
 
 domain_codes = ["edtech", "ai", "health", "fintech", "sustainability"]
 stages = ["idea", "prototype", "mvp", "growth"]
 
 idea_id = 1
 idea_pool = enrolled_student_ids if enrolled_student_ids else student_ids
-for sid in random.sample(idea_pool, k=min(len(idea_pool), 30)):
+for sid in rng.choice(
+    np.array(idea_pool), size=min(len(idea_pool), 30), replace=False
+).tolist():
     idea_dim.append(
-        {
-            "idea_id": idea_id,
-            "student_id": sid,
-            "domain_code": random.choice(domain_codes),
-            "title": f"Idea {idea_id}",
-            "stage": random.choice(stages),
-            "created_at": START_DATE.date(),
-        }
+        (
+            idea_id,
+            sid,
+            random.choice(domain_codes),
+            f"Idea {idea_id}",
+            random.choice(stages),
+            START_DATE.date(),
+        )
     )
     idea_id += 1
 
-mentor_profile_ids = random.sample(mentor_ids, k=min(len(mentor_ids), 3))
+mentor_profile_ids = rng.choice(
+    np.array(mentor_ids), size=min(len(mentor_ids), 3), replace=False
+).tolist()
 for mid in mentor_profile_ids:
     mentor_profile.append(
-        {
-            "mentor_id": mid,
-            "primary_domain_code": random.choice(domain_codes),
-            "years_exp": random.randint(2, 15),
-        }
+        (mid, random.choice(domain_codes), random.randint(2, 15))
     )
 
 match_id = 1
@@ -793,25 +843,25 @@ for idea in idea_dim:
         else:
             matched_at = START_DATE + timedelta(days=random.randint(10, 120))
         mentor_match.append(
-            {
-                "match_id": match_id,
-                "idea_id": idea["idea_id"],
-                "mentor_id": mentor_id,
-                "matched_at": matched_at,
-                "status": random.choice(["active", "completed"]),
-            }
+            (
+                match_id,
+                idea[0],  # idea_id
+                mentor_id,
+                matched_at,
+                random.choice(["active", "completed"]),
+            )
         )
         # meetings
         for _ in range(random.randint(1, 3)):
             mt = matched_at + timedelta(days=random.randint(1, 30))
             mentor_meeting.append(
-                {
-                    "meeting_id": meeting_id,
-                    "match_id": match_id,
-                    "meeting_time": mt,
-                    "mode": random.choice(["online", "offline"]),
-                    "notes": "Session notes",
-                }
+                (
+                    meeting_id,
+                    match_id,
+                    mt,
+                    random.choice(["online", "offline"]),
+                    "Session notes",
+                )
             )
             meeting_id += 1
         # action items
@@ -819,26 +869,26 @@ for idea in idea_dim:
             due = matched_at + timedelta(days=random.randint(7, 45))
             done = due + timedelta(days=random.randint(0, 7)) if random.random() > 0.35 else None
             action_item.append(
-                {
-                    "action_id": action_id,
-                    "match_id": match_id,
-                    "title": f"Action {action_id}",
-                    "owner": random.choice(["mentor", "student"]),
-                    "due_date": due,
-                    "status": "done" if done else "open",
-                    "done_at": done,
-                }
+                (
+                    action_id,
+                    match_id,
+                    f"Action {action_id}",
+                    random.choice(["mentor", "student"]),
+                    due,
+                    "done" if done else "open",
+                    done,
+                )
             )
             action_id += 1
         base_score = max(45, min(97, random.gauss(75, 12)))
         if matched_at >= END_DATE - timedelta(days=14):
             base_score = min(99, base_score + random.randint(3, 10))
         pitch_readiness.append(
-            {
-                "match_id": match_id,
-                "score_0_100": int(round(base_score)),
-                "rated_at": matched_at + timedelta(days=random.randint(5, 60)),
-            }
+            (
+                match_id,
+                int(round(base_score)),
+                matched_at + timedelta(days=random.randint(5, 60)),
+            )
         )
         match_id += 1
 
@@ -886,51 +936,53 @@ write_csv(
     mdl_course,
 )
 write_csv("mdl_enrol.csv", ["id", "enrol", "status", "courseid", "timecreated"], mdl_enrol)
-write_csv(
+write_fmt_csv(
     "mdl_user_enrolments.csv",
     ["id", "enrolid", "userid", "timestart"],
     mdl_user_enrolments,
+    "%d,%d,%d,%d\n",
 )
 write_csv(
     "mdl_assign.csv",
     ["id", "course", "name", "duedate", "timemodified"],
     mdl_assign,
 )
-write_csv(
+write_fmt_csv(
     "mdl_assign_submission.csv",
     ["id", "assignment", "userid", "status", "timecreated", "timemodified"],
     mdl_assign_submission,
+    "%d,%d,%d,%s,%d,%d\n",
 )
 write_csv(
     "mdl_grade_items.csv",
     ["id", "courseid", "itemtype", "itemmodule", "iteminstance", "itemname", "grademax"],
     mdl_grade_items,
 )
-write_csv(
+write_fmt_csv(
     "mdl_grade_grades.csv",
     ["id", "itemid", "userid", "rawgrade", "finalgrade", "timemodified"],
     mdl_grade_grades,
+    "%d,%d,%d,%s,%s,%d\n",
 )
-write_csv(
+write_fmt_csv(
     "mdl_course_modules.csv",
     ["id", "course", "module", "instance", "section"],
     mdl_course_modules,
+    "%d,%d,%d,%d,%d\n",
 )
-write_csv(
+write_fmt_csv(
     "mdl_course_modules_completion.csv",
     ["id", "coursemoduleid", "userid", "completionstate", "timemodified"],
     mdl_course_modules_completion,
+    "%d,%d,%d,%d,%d\n",
 )
-write_csv(
+write_fmt_csv(
     "mdl_course_modules_viewed.csv",
     ["id", "coursemoduleid", "userid", "timecreated"],
     mdl_course_modules_viewed,
+    "%d,%d,%d,%d\n",
 )
-write_csv(
-    "mdl_logstore_standard_log.csv",
-    ["id", "eventname", "component", "action", "target", "objectid", "userid", "courseid", "contextid", "timecreated", "origin"],
-    mdl_logstore_standard_log,
-)
+# mdl_logstore_standard_log.csv is streamed by the events loop above
 write_csv(
     "mdl_course_completion_criteria.csv",
     ["id", "course", "criteriatype", "module", "moduleinstance", "courseinstance", "enrolperiod", "timeend", "gradepass", "role"],
@@ -976,94 +1028,101 @@ write_csv(
     ["id", "feedback", "userid", "timemodified"],
     mdl_feedback_completed,
 )
-write_csv(
+write_fmt_csv(
     "mdl_feedback_value.csv",
     ["id", "item", "completed", "value"],
     mdl_feedback_value,
+    "%d,%d,%d,%s\n",
 )
 
 # ---------------- Extra lightweight CSVs ---------------- #
-session_fact: List[Dict] = []
-for u in user_dim:
-    for _ in range(random.randint(2, 6)):
-        login_at = START_DATE + timedelta(days=random.randint(0, 120), hours=random.randint(6, 22))
-        last_seen_at = login_at + timedelta(minutes=random.randint(5, 180))
-        logout_at = last_seen_at + timedelta(minutes=random.randint(1, 30))
-        session_fact.append(
-            {
-                "user_id": u["user_id"],
-                "login_at": login_at,
-                "last_seen_at": last_seen_at,
-                "logout_at": logout_at,
-            }
-        )
+# each table draws its randomness in bulk (one rng call per column) and
+# assembles rows from the arrays, instead of 3-4 scalar random.* calls
+# per row
+sess_per_user = rng.integers(2, 7, len(user_dim))
+n_sessions = int(sess_per_user.sum())
+sess_uids = np.repeat([u[0] for u in user_dim], sess_per_user).tolist()
+sess_days = rng.integers(0, 121, n_sessions)
+sess_hours = rng.integers(6, 23, n_sessions)
+sess_minutes = rng.integers(5, 181, n_sessions)
+sess_gaps = rng.integers(1, 31, n_sessions)
+
+# the three timestamp columns are pure datetime64 arithmetic on the
+# drawn offsets — no Python datetime is ever constructed — and to_csv
+# renders datetime64[s] exactly like str(datetime)
+_sess_login = np.datetime64(START_DATE, "s") + (
+    sess_days * 86400 + sess_hours * 3600
+).astype("timedelta64[s]")
+_sess_last_seen = _sess_login + (sess_minutes * 60).astype("timedelta64[s]")
+session_df = pd.DataFrame(
+    {
+        "user_id": sess_uids,
+        "login_at": _sess_login,
+        "last_seen_at": _sess_last_seen,
+        "logout_at": _sess_last_seen + (sess_gaps * 60).astype("timedelta64[s]"),
+    }
+)
+
+# error_log and mentor_availability timestamps are all hour-aligned, so
+# only ~150 days x 24 hours distinct strings exist: format them once and
+# index, instead of building a datetime and str()-ing it per field
+DAY_HOUR_STR = [[f"{ds} {h:02d}:00:00" for h in range(24)] for ds in day_strs]
 
-error_log: List[Dict] = []
+NUM_ERRORS = 80
 services = ["api", "db", "auth", "web"]
-for _ in range(80):
-    ts = START_DATE + timedelta(days=random.randint(0, 150), hours=random.randint(0, 23))
-    error_log.append(
-        {
-            "timestamp": ts,
-            "service": random.choice(services),
-            "error_code": random.choice(["E500", "E502", "E401", "E403", "E_TIMEOUT"]),
-            "severity": random.choice(["low", "medium", "high"]),
-        }
-    )
+error_codes = ["E500", "E502", "E401", "E403", "E_TIMEOUT"]
+severities = ["low", "medium", "high"]
+err_days = rng.integers(0, 151, NUM_ERRORS)
+err_hours = rng.integers(0, 24, NUM_ERRORS)
+err_svc = rng.integers(0, len(services), NUM_ERRORS)
+err_code = rng.integers(0, len(error_codes), NUM_ERRORS)
+err_sev = rng.integers(0, len(severities), NUM_ERRORS)
 
-db_metrics_daily: List[Dict] = []
-db_size = 512
-for day in daterange(START_DATE, END_DATE):
-    db_size += random.uniform(0.2, 1.5)
-    db_metrics_daily.append(
-        {
-            "date": day.date(),
-            "db_size_mb": round(db_size, 2),
-        }
-    )
+error_log = (
+    (DAY_HOUR_STR[d][h], services[s], error_codes[c], severities[v])
+    for d, h, s, c, v in zip(err_days, err_hours, err_svc, err_code, err_sev)
+)
 
-user_status: List[Dict] = []
-for u in random.sample(user_dim, k=min(len(user_dim), 12)):
-    blocked_at = START_DATE + timedelta(days=random.randint(5, 140))
-    user_status.append(
-        {
-            "user_id": u["user_id"],
-            "status": random.choice(["active", "blocked", "suspended"]),
-            "reason": random.choice(["spam", "policy", "security", "inactive"]),
-            "blocked_at": blocked_at,
-        }
+# cumulative sum over one batched uniform draw replaces the running total
+db_sizes = 512 + np.cumsum(rng.uniform(0.2, 1.5, len(DAY_ISO)))
+db_metrics_daily = (
+    (day_iso, round(float(s), 2)) for day_iso, s in zip(DAY_ISO, db_sizes)
+)
+
+statuses = ["active", "blocked", "suspended"]
+status_reasons = ["spam", "policy", "security", "inactive"]
+flagged_idx = rng.choice(len(user_dim), size=min(len(user_dim), 12), replace=False)
+blocked_days = rng.integers(5, 141, len(flagged_idx))
+status_pick = rng.integers(0, len(statuses), len(flagged_idx))
+reason_pick = rng.integers(0, len(status_reasons), len(flagged_idx))
+
+user_status = (
+    (
+        user_dim[i][0],
+        statuses[s],
+        status_reasons[r],
+        START_DATE + timedelta(days=int(d)),
     )
+    for i, d, s, r in zip(flagged_idx, blocked_days, status_pick, reason_pick)
+)
 
-mentor_availability: List[Dict] = []
-for mid in mentor_profile_ids:
-    for _ in range(random.randint(3, 6)):
-        start_time = START_DATE + timedelta(days=random.randint(0, 120), hours=random.randint(8, 18))
-        end_time = start_time + timedelta(hours=random.randint(1, 3))
+mentor_availability: List[Tuple] = []
+slots_per_mentor = rng.integers(3, 7, len(mentor_profile_ids))
+for mid, n_slots in zip(mentor_profile_ids, slots_per_mentor):
+    slot_days = rng.integers(0, 121, n_slots)
+    slot_hours = rng.integers(8, 19, n_slots)
+    slot_lens = rng.integers(1, 4, n_slots)
+    slot_free = rng.integers(0, 2, n_slots)
+    for d, h, ln, free in zip(slot_days, slot_hours, slot_lens, slot_free):
         mentor_availability.append(
-            {
-                "mentor_id": mid,
-                "start_time": start_time,
-                "end_time": end_time,
-                "is_free": random.choice([0, 1]),
-            }
-        )
-    # ensure some availability near "today"
-    for _ in range(2):
-        start_time = END_DATE + timedelta(hours=random.randint(8, 18))
-        end_time = start_time + timedelta(hours=2)
-        mentor_availability.append(
-            {
-                "mentor_id": mid,
-                "start_time": start_time,
-                "end_time": end_time,
-                "is_free": 1,
-            }
+            (mid, DAY_HOUR_STR[d][h], DAY_HOUR_STR[d][h + ln], int(free))
         )
+    # ensure some availability near "today" (END_DATE is the last day axis entry)
+    for h in rng.integers(8, 19, 2):
+        mentor_availability.append((mid, DAY_HOUR_STR[-1][h], DAY_HOUR_STR[-1][h + 2], 1))
 
-write_csv(
-    "session_fact.csv",
-    ["user_id", "login_at", "last_seen_at", "logout_at"],
-    session_fact,
+_write_futures.append(
+    _write_pool.submit(session_df.to_csv, BASE / "session_fact.csv", index=False)
 )
 write_csv(
     "error_log.csv",
@@ -1086,4 +1145,8 @@ write_csv(
     mentor_availability,
 )
 
+for fut in _write_futures:
+    fut.result()  # propagate any write error
+_write_pool.shutdown()
+
 print(f"Wrote CSVs to {BASE} (simplified + core-like)")